@@ -550,7 +550,8 @@ class MainController(QObject):
     def stop(self, on_result=None, on_error=None, on_finished=None) -> bool:
         """Stop robot movement."""
         try:
-            result = self.manual_movement_model.run_in_thread(self.manual_movement_model.stop, on_result=on_result, on_error=on_error, on_finished=on_finished)
+            result = self.manual_movement_model.run_in_thread(self.manual_movement_model.stop, on_result=on_result, on_error=on_error, on_finished=on_finished,
+                                                              pool=self.manual_movement_model.stop_pool)
             if result:
                 print("Robot stopped")
             return result
@@ -601,7 +602,7 @@ class MainController(QObject):
         """Clear all saved positions."""
         self.manual_movement_model.clear_saved_positions()
 
-    def get_saved_positions(self) -> list:
+    def get_saved_positions(self) -> tuple:
         """Get all saved positions."""
         return self.manual_movement_model.get_saved_positions()
 
@@ -719,6 +720,10 @@ class MainController(QObject):
                     self.stop_camera_capture(camera_name)
                 except Exception as e:
                     print(f"Error stopping camera {camera_name}: {e}")
+
+            # Release the robot API's pooled HTTP connections
+            if globals.robot_api:
+                globals.robot_api.close()
         
             print("Application cleanup completed")
         except Exception as e:
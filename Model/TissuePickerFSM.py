@@ -363,8 +363,8 @@ class TissuePickerFSM(QObject):
 
     def state_pickup_sample(self):
         for x,y in self.world_coordinates:
-            globals.robot_api.move_to_coordinates((x, y, self.config.pickup_height+20), min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
-            globals.robot_api.move_to_coordinates((x, y, self.config.pickup_height), min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
+            globals.robot_api.move_to_coordinates_batch([(x, y, self.config.pickup_height+20), (x, y, self.config.pickup_height)],
+                                                        min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
             globals.robot_api.aspirate_in_place(flow_rate = self.config.flow_rate, volume = self.config.vol)
             globals.robot_api.move_relative('z', 20)
 
@@ -411,8 +411,8 @@ class TissuePickerFSM(QObject):
 
     def state_deposit_liquid_back(self):
         x,y = self.world_coordinates[0]  # Use the first coordinate for depositing back
-        globals.robot_api.move_to_coordinates((x, y, self.config.pickup_height+20), min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
-        globals.robot_api.move_to_coordinates((x, y, self.config.pickup_height+0.5), min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
+        globals.robot_api.move_to_coordinates_batch([(x, y, self.config.pickup_height+20), (x, y, self.config.pickup_height+0.5)],
+                                                    min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
         globals.robot_api.dispense_in_place(flow_rate = self.config.flow_rate, volume = self.config.vol * len(self.world_coordinates))
         time.sleep(0.5)
         globals.robot_api.move_relative('z', 20)
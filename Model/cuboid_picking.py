@@ -20,7 +20,7 @@ class CuboidPickingModel:
         self.tissue_picker_fsm: Optional[TissuePickerFSM] = None
         self.controller = None
         self.is_picking_active = False
-        self.active_threads = []
+        self.active_threads = set()
         self.fsm_thread = None  # Dedicated thread for FSM
     
     def run_in_thread(self, fn, *args, on_result=None, on_error=None, on_finished=None, **kwargs):
@@ -37,8 +37,7 @@ class CuboidPickingModel:
             worker.finished.connect(on_finished)
 
         def cleanup():
-            if thread in self.active_threads:
-                self.active_threads.remove(thread)
+            self.active_threads.discard(thread)
             thread.quit()
             thread.wait()  # Wait for thread to finish
             worker.deleteLater()
@@ -47,7 +46,7 @@ class CuboidPickingModel:
         worker.finished.connect(cleanup)
         thread.started.connect(worker.run)
 
-        self.active_threads.append(thread)
+        self.active_threads.add(thread)
         thread.start()
         return thread
     
@@ -224,7 +223,7 @@ class CuboidPickingModel:
                 self.stop_cuboid_picking()
                 
             # Clean up any remaining active threads
-            for thread in self.active_threads[:]:  # Copy list to avoid modification during iteration
+            for thread in list(self.active_threads):  # Copy set to avoid modification during iteration
                 try:
                     thread.quit()
                     thread.wait(1000)  # Wait up to 1 second
@@ -4,24 +4,50 @@ Contains functionality for managing labware declarations and configurations.
 """
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
 import Model.globals as globals
 import paths
 import requests
-from PyQt6.QtCore import QThread
-from Model.worker import Worker
+from PyQt6.QtCore import QThreadPool
+from Model.worker import PooledWorker
 from Model.frame_capture import get_frame_capturer
 import cv2
 import Model.utils as utils
 import time
 import numpy as np
-from ultralytics import YOLO    
-import pandas as pd
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Camera name constants - using user labels that match controller
 OverviewCameraName = "overview_cam_2"  # User label for overview camera
 UnderviewCameraName = "underview_cam"  # User label for underview camera
 
+# Inference size of the tip detector
+TIP_DETECTOR_IMGSZ = 2016
+# Print pixel-level tip calibration diagnostics to the terminal
+DEBUG_CALIBRATION = False
+
+# Deck slot keys as used in globals.deck_layout (interned so lookups hit on identity)
+DECK_SLOT_KEYS = tuple(sys.intern(f"slot_{i}") for i in range(1, 13))
+
+# Labware definitions that ship with the robot
+BUILT_IN_LABWARE = (
+    "corning_12_wellplate_6.9ml_flat",
+    "corning_24_wellplate_3.4ml_flat",
+    "corning_384_wellplate_112ul_flat",
+    "corning_48_wellplate_1.6ml_flat",
+    "corning_6_wellplate_16.8ml_flat",
+    "corning_96_wellplate_360ul_flat",
+    "corning_96_wellplate_360ul_lid",
+    "opentrons_96_tiprack_300ul"
+)
+
 class LabwareModel:
     """Model for handling labware declarations and configurations."""
     
@@ -30,16 +56,22 @@ class LabwareModel:
         if not isinstance(globals.deck_layout, dict) or not globals.deck_layout:
             globals.deck_layout = self.get_default_deck_layout()
         
+        self._available_cache_key = None
+        self._available_cache = None
         self.available_labware = self.get_available_labware()
-        self.active_threads = []
         # Frame capturer will be initialized with proper controller later
         self.frame_capturer = get_frame_capturer()
+        # Calibration resources are loaded on first use and reused across calibrations
+        self._yolo_model = None
+        self._yolo_model_path = None
+        self._yolo_half = False
+        self._calibration_cache_key = None
+        self._calibration_cache = None
 
     def run_in_thread(self, fn, *args, on_result=None, on_error=None, on_finished=None, **kwargs):
-        """Run a function in a separate thread using Worker."""
-        thread = QThread()
-        worker = Worker(fn, *args, **kwargs)
-        worker.moveToThread(thread)
+        """Run a function on the shared Qt thread pool using Worker."""
+        runnable = PooledWorker(fn, *args, **kwargs)
+        worker = runnable.worker
 
         if on_result:
             worker.result.connect(on_result)
@@ -48,57 +80,31 @@ class LabwareModel:
         if on_finished:
             worker.finished.connect(on_finished)
 
-        def cleanup():
-            if thread in self.active_threads:
-                self.active_threads.remove(thread)
-            thread.quit()
-            thread.wait()  # Wait for thread to finish
-            worker.deleteLater()
-            thread.deleteLater()
-
-        worker.finished.connect(cleanup)
-        thread.started.connect(worker.run)
-
-        self.active_threads.append(thread)
-        thread.start()
-        return thread
+        QThreadPool.globalInstance().start(runnable)
+        return runnable
         
     def get_default_deck_layout(self) -> Dict[str, Any]:
         """Get default deck layout configuration."""
-        return {
-            "slot_1": None,
-            "slot_2": None,
-            "slot_3": None,
-            "slot_4": None,
-            "slot_5": None,
-            "slot_6": None,
-            "slot_7": None,
-            "slot_8": None,
-            "slot_9": None,
-            "slot_10": None,
-            "slot_11": None,
-            "slot_12": None
-        }
+        return dict.fromkeys(DECK_SLOT_KEYS)
     
     def get_available_labware(self) -> List[str]:
         """Get list of available labware types as strings, including protocol JSONs."""
         # Add protocol JSONs (without .json extension)
-        if globals.get_run_info or globals.custom_labware:
-            return self.get_built_in_labware() + globals.protocol_labware
-        return self.get_built_in_labware()
+        protocol_labware = globals.protocol_labware if (globals.get_run_info or globals.custom_labware) else ()
+        # Only rebuild when the protocol list is replaced or resized
+        cache_key = self._available_cache_key
+        if cache_key is None or cache_key[0] is not protocol_labware or cache_key[1] != len(protocol_labware):
+            self._available_cache = [*BUILT_IN_LABWARE, *protocol_labware]
+            self._available_cache_key = (protocol_labware, len(protocol_labware))
+        return self._available_cache
     
     def get_built_in_labware(self) -> List[str]:
-        return [
-            "corning_12_wellplate_6.9ml_flat",
-            "corning_24_wellplate_3.4ml_flat",
-            "corning_384_wellplate_112ul_flat",
-            "corning_48_wellplate_1.6ml_flat",
-            "corning_6_wellplate_16.8ml_flat",
-            "corning_96_wellplate_360ul_flat",
-            "corning_96_wellplate_360ul_lid",
-            "opentrons_96_tiprack_300ul"
-        ]
+        return list(BUILT_IN_LABWARE)
+
 
+    def _is_valid_slot(self, slot: int) -> bool:
+        """Check that labware can be loaded into the slot (slot 12 is the fixed trash)."""
+        return isinstance(slot, int) and 1 <= slot <= 11
 
     def get_slot_configuration(self, slot: str) -> Optional[str]:
         """Get configuration for a specific deck slot."""
@@ -116,12 +122,14 @@ class LabwareModel:
                 return False
             
             # Validate slot number
-            if slot not in range(1, 12):
+            if not self._is_valid_slot(slot):
                 print(f"Invalid slot number: {slot}. Must be between 1 and 11.")
                 return False
-            
+
+            slot_key = DECK_SLOT_KEYS[slot - 1]
+
             # Extract labware type from labware name (word between second and third underscore)
-            parts = labware.split('_')
+            parts = labware.split('_', 3)
             if len(parts) > 2:
                 labware_type = parts[2]
             else:
@@ -139,10 +147,10 @@ class LabwareModel:
                 return False
             
             # Update both global and local configuration
-            slot_key = f"slot_{slot}"
             slot_config = {
                 "labware_name": labware,
                 "labware_type": labware_type,
+                "is_tiprack": "tiprack" in labware.lower(),
             }
             
             # Update global deck layout
@@ -158,7 +166,6 @@ class LabwareModel:
         """Clear labware from a specific deck slot."""
         try:
             globals.robot_api.move_labware(globals.robot_api.labware_dct[str(slot)], "offDeck")
-            print(globals.robot_api.labware_dct[str(slot)])
             # Clear from global configuration
             globals.deck_layout[f"slot_{slot}"] = None
             return True
@@ -174,20 +181,7 @@ class LabwareModel:
         """Clear all labware from the deck."""
         try:
             # Clear global deck layout
-            globals.deck_layout = {
-                "slot_1": None,
-                "slot_2": None,
-                "slot_3": None,
-                "slot_4": None,
-                "slot_5": None,
-                "slot_6": None,
-                "slot_7": None,
-                "slot_8": None,
-                "slot_9": None,
-                "slot_10": None,
-                "slot_11": None,
-                "slot_12": None
-            }
+            globals.deck_layout = dict.fromkeys(DECK_SLOT_KEYS)
             return True
         except Exception as e:
             print(f"Error clearing deck: {e}")
@@ -197,53 +191,36 @@ class LabwareModel:
         protocols_dir = os.path.join(paths.BASE_DIR, 'protocols')
         
         # Check if protocols directory exists and has JSON files
-        if not os.path.isdir(protocols_dir):
+        try:
+            with os.scandir(protocols_dir) as entries:
+                json_files = [entry.name for entry in entries
+                              if entry.name.endswith('.json') and entry.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
             print("Protocols directory not found.")
             return False
-            
-        json_files = [f for f in os.listdir(protocols_dir) if f.endswith('.json')]
+
         if not json_files:
             print("No custom labware JSON files found.")
             return False
 
-        success = True
-
         # Upload custom labware to robot
         if not globals.robot_api or not globals.robot_initialized:
             print("Robot not initialized. Please initialize first.")
             return False
 
-        for json_file_name in json_files:
-            custom_labware_path = os.path.join(protocols_dir, json_file_name)
-            try:
-                with open(custom_labware_path, 'r', encoding='utf-8') as json_file:
-                    custom_labware = json.load(json_file)
-
-                command_dict = {
-                    "data": custom_labware
-                }
-                command_payload = json.dumps(command_dict)
-
-                url = globals.robot_api.get_url('runs') + f'/{globals.robot_api.run_id}/' + 'labware_definitions'
-                r = requests.post(url=url, headers=globals.robot_api.HEADERS, params={"waitUntilComplete": True}, data=command_payload)
-                if not r.ok:
-                    print(f"Failed to upload {json_file_name}: {r.text}")
-                    success = False
-                else:
-                    print(f"Successfully uploaded {json_file_name}")
-            except Exception as e:
-                print(f"Error uploading {json_file_name}: {e}")
-                success = False
+        url = globals.robot_api.get_url('runs') + f'/{globals.robot_api.run_id}/' + 'labware_definitions'
+        labware_paths = [os.path.join(protocols_dir, json_file_name) for json_file_name in json_files]
+        # Reuse the robot API's keep-alive session and upload the definitions concurrently
+        session = globals.robot_api.session
+        with ThreadPoolExecutor(max_workers=min(4, len(labware_paths))) as executor:
+            results = list(executor.map(
+                lambda path: self._upload_labware_definition(session, url, path), labware_paths))
+        success = all(results)
         
         # Only set custom_labware to True and update the list if we were successful
         if success:
             globals.custom_labware = True
-            protocols_dir = os.path.join(paths.BASE_DIR, 'protocols')
-            if os.path.isdir(protocols_dir):
-                globals.protocol_labware = []
-                for f in os.listdir(protocols_dir):
-                    if f.endswith('.json'):
-                        globals.protocol_labware.append(os.path.splitext(f)[0])
+            globals.protocol_labware = [os.path.splitext(f)[0] for f in json_files]
             # Update available labware list to include protocol JSONs
             self.available_labware = self.get_available_labware()
             print("Custom labware list updated successfully.")
@@ -252,27 +229,47 @@ class LabwareModel:
             
         return success
     
+    def _upload_labware_definition(self, session: requests.Session, url: str, custom_labware_path: str) -> bool:
+        """Upload a single custom labware JSON file to the current run."""
+        json_file_name = os.path.basename(custom_labware_path)
+        try:
+            with open(custom_labware_path, 'rb') as json_file:
+                raw_labware = json_file.read()
+            # Validate once, then wrap the raw bytes instead of re-serializing the definition
+            _json_loads(raw_labware)
+            command_payload = b'{"data":' + raw_labware + b'}'
+
+            # Payloads are pre-encoded bytes, so requests won't set the content type itself
+            r = session.post(url=url, params={"waitUntilComplete": True}, data=command_payload,
+                             headers={"Content-Type": "application/json"})
+            if not r.ok:
+                print(f"Failed to upload {json_file_name}: {r.text}")
+                return False
+            print(f"Successfully uploaded {json_file_name}")
+            return True
+        except Exception as e:
+            print(f"Error uploading {json_file_name}: {e}")
+            return False
+
     def get_occupied_slots(self) -> List[str]:
         """Get list of slots that have labware assigned."""
-        occupied = []
-        for slot, config in globals.deck_layout.items():
-            if config is not None:
-                occupied.append(slot)
-        return occupied
-    
+        return [slot for slot, config in globals.deck_layout.items() if config is not None]
+
     def get_empty_slots(self) -> List[str]:
         """Get list of empty slots on the deck."""
-        empty = []
-        for slot, config in globals.deck_layout.items():
-            if config is None:
-                empty.append(slot)
-        return empty
+        return [slot for slot, config in globals.deck_layout.items() if config is None]
     
     def get_tiprack_slots(self) -> List[Dict[str, Any]]:
         """Get list of slots containing tiprack labware."""
         tipracks = []
         for slot, config in globals.deck_layout.items():
-            if config and "tiprack" in config["labware_name"].lower():
+            if not config:
+                continue
+            # Slots restored from run info do not carry the precomputed flag
+            is_tiprack = config.get("is_tiprack")
+            if is_tiprack is None:
+                is_tiprack = "tiprack" in config["labware_name"].lower()
+            if is_tiprack:
                 tipracks.append({
                     "slot": slot,
                     "slot_number": slot.replace("slot_", ""),
@@ -288,9 +285,12 @@ class LabwareModel:
                 print("Robot not initialized. Please initialize first.")
                 return False
             
+            if not self._is_valid_slot(slot):
+                print(f"Invalid slot number: {slot}. Must be between 1 and 11.")
+                return False
+
             # Validate slot has tiprack
-            slot_key = f"slot_{slot}"
-            slot_config = globals.deck_layout.get(slot_key)
+            slot_config = globals.deck_layout.get(DECK_SLOT_KEYS[slot - 1])
             if not slot_config:
                 print(f"No labware found in slot {slot}")
                 return False
@@ -319,114 +319,141 @@ class LabwareModel:
     def _ensure_lights_on(self) -> None:
         """Ensure robot lights are turned on for calibration."""
         current_status = globals.robot_api.get("lights", globals.robot_api.HEADERS)
-        current_status = json.loads(current_status.text)
+        current_status = _json_loads(current_status.content)
         if not current_status['on']:
-            globals.robot_api.toggle_lights()
-
-    def _load_calibration_resources(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Any]:
+            # Switch on directly; toggle_lights() would query the state a second time
+            globals.robot_api.post("lights", headers=globals.robot_api.HEADERS, data=json.dumps({"on": True}))
+
+    def _load_calibration_data(self) -> Dict[str, Any]:
+        """Load the calibration config, reusing the last read while the file is unchanged."""
+        profile = globals.calibration_profile
+        config_path = os.path.join(paths.PROFILES_DIR, profile, 'calibration.json')
+        # Key on the file's mtime too, since the settings model rewrites calibration.json
+        cache_key = (profile, os.stat(config_path).st_mtime_ns)
+        if self._calibration_cache_key != cache_key:
+            self._calibration_cache = utils.load_calibration_config(profile)
+            self._calibration_cache_key = cache_key
+        return self._calibration_cache
+
+    def _load_calibration_resources(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Any, Dict[str, Any]]:
         """Load calibration data, model, and cameras."""
         # Load calibration data
-        calibration_data = utils.load_calibration_config(globals.calibration_profile)
+        calibration_data = self._load_calibration_data()
         tf_mtx = np.array(calibration_data['tf_mtx'])
         calib_origin = np.array(calibration_data['calib_origin'])[:2]
         offset = np.array(calibration_data['offset'])
         
-        # Load YOLO model
+        # Load YOLO model once; the weights are only re-read if the model path changes
         model_path = os.path.join(paths.ML_MODELS_DIR, 'tip_detector_v1.pt')
-        model = YOLO(model_path)
+        if self._yolo_model is None or self._yolo_model_path != model_path:
+            # Imported here so torch is only pulled in once calibration is actually used
+            import torch
+            from ultralytics import YOLO
+            self._yolo_model = YOLO(model_path)
+            self._yolo_model_path = model_path
+            # Predict runs on CUDA when available; older ultralytics releases
+            # do not fall back from FP16 on CPU, so only ask for half there
+            self._yolo_half = torch.cuda.is_available()
         
-        return tf_mtx, calib_origin, offset, model
+        return tf_mtx, calib_origin, offset, self._yolo_model, calibration_data
+
+    def _predict_objects(self, model: Any, image: np.ndarray) -> Dict[str, np.ndarray]:
+        """Run YOLO prediction on image and extract object data as parallel arrays."""
+        # Shrink frames larger than the inference size here, with OpenCV, rather
+        # than copying the full frame through ultralytics' letterboxing
+        height, width = image.shape[:2]
+        scale = TIP_DETECTOR_IMGSZ / max(height, width)
+        if scale < 1:
+            image = cv2.resize(image, (round(width * scale), round(height * scale)), interpolation=cv2.INTER_AREA)
 
-    def _predict_objects(self, model: Any, image: np.ndarray) -> List[Dict[str, Any]]:
-        """Run YOLO prediction on image and extract object data."""
         results = model.predict(
             source=image,
             conf=0.25,
             save=False,
             save_txt=False,
             show=False,
-            imgsz=2016,
+            imgsz=TIP_DETECTOR_IMGSZ,
+            half=self._yolo_half,
             verbose=False
         )
         
-        data = []
-        for r in results:
-            for box in r.boxes:
-                cls = int(box.cls[0])
-                conf = float(box.conf[0])
-                x1, y1, x2, y2 = map(int, box.xyxy[0])
-                center_x = (x1 + x2) // 2
-                center_y = (y1 + y2) // 2
-                data.append({
-                    'class': model.names[cls], 
-                    'confidence': conf, 
-                    'center_x': center_x, 
-                    'center_y': center_y
-                })
-        return data
+        # A single image is passed in, so there is exactly one result.
+        # Pull its box tensors off the device once and decode them together
+        boxes = results[0].boxes
+        names = model.names
+        cls_arr = boxes.cls.cpu().numpy().astype(np.int32)
+        xyxy = boxes.xyxy.cpu().numpy()
+        if scale < 1:
+            # Map boxes back to the original frame's pixel coordinates
+            xyxy = xyxy / scale
+        xyxy = xyxy.astype(np.int32)
+        return {
+            'class': np.array([names[cls] for cls in cls_arr.tolist()], dtype=str),
+            'confidence': boxes.conf.cpu().numpy(),
+            'center_x': (xyxy[:, 0] + xyxy[:, 2]) // 2,
+            'center_y': (xyxy[:, 1] + xyxy[:, 3]) // 2
+        }
 
-    def _find_closest_point(self, data: List[Dict[str, Any]], image_center: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    def _find_closest_point(self, data: Dict[str, np.ndarray], image_center: Tuple[int, int]) -> Optional[Dict[str, Any]]:
         """Find the point object closest to the center of the image."""
-        if not data:
+        point_mask = data['class'] == 'point'
+        if not point_mask.any():
             return None
-            
-        closest_obj = min(
-            (obj for obj in data if obj['class'] == 'point'),
-            key=lambda obj: (obj['center_x'] - image_center[0]) ** 2 + (obj['center_y'] - image_center[1]) ** 2,
-            default=None
-        )
-        return closest_obj
+
+        center_x = data['center_x'][point_mask]
+        center_y = data['center_y'][point_mask]
+        dx = center_x - image_center[0]
+        dy = center_y - image_center[1]
+        closest = int(np.argmin(dx * dx + dy * dy))
+        return {
+            'class': 'point',
+            'confidence': float(data['confidence'][point_mask][closest]),
+            'center_x': int(center_x[closest]),
+            'center_y': int(center_y[closest])
+        }
 
     def _calculate_robot_coordinates(self, crosshair_x: int, crosshair_y: int, 
-                                   tf_mtx: np.ndarray, calibration_data: Dict, 
-                                   detection_offset_x: float, detection_offset_y: float) -> Tuple[float, float]:
-        """Calculate robot coordinates from detected point."""
+                                   tf_mtx: np.ndarray, calib_origin: np.ndarray, offset: np.ndarray, 
+                                   detection_offset_x: float, detection_offset_y: float) -> Tuple[float, float, np.ndarray]:
+        """Calculate robot coordinates from detected point, and the point itself before the stored offset."""
         X_init, Y_init, _ = tf_mtx @ (crosshair_x, crosshair_y, 1)
-        print(f'Initial coordinates: {X_init}, {Y_init}')
+        if DEBUG_CALIBRATION:
+            print(f'Initial coordinates: {X_init}, {Y_init}')
 
         x, y, _ = globals.robot_api.get_position(verbose=False)[0].values()
-        diff = np.array([x, y]) - np.array(calibration_data['calib_origin'])[:2]
-        X = X_init + diff[0] + calibration_data['offset'][0]
-        Y = Y_init + diff[1] + calibration_data['offset'][1]
+        point_xy = np.array([X_init + x, Y_init + y]) - calib_origin
+        X, Y = point_xy + offset[:2]
 
         print(f"Robot coords: ({x}, {y})")
         print(f"Target coords: ({X}, {Y})")
         
-        return X + detection_offset_x, Y + detection_offset_y, diff
+        return X + detection_offset_x, Y + detection_offset_y, point_xy
 
-    def _analyze_tip_position(self, df: pd.DataFrame, image_center: Tuple[int, int]) -> Tuple[float, float]:
+    def _analyze_tip_position(self, data: Dict[str, np.ndarray], image_center: Tuple[int, int]) -> Tuple[float, float]:
         """Analyze tip position relative to calibration points."""
-        # Calculate distance to center for each point
-        df['distance_to_center'] = ((df['center_x'] - image_center[0]) ** 2 + 
-                                   (df['center_y'] - image_center[1]) ** 2) ** 0.5
+        classes = data['class']
+        coords = np.column_stack((data['center_x'], data['center_y']))
+        point_mask = classes == 'point'
+        tip_mask = classes == 'tip'
+
+        # Calculate squared distance to center for each point (ranking needs no sqrt)
+        point_coords = coords[point_mask]
+        if not len(point_coords):
+            raise AssertionError("No 'point' class detected in the underview image.")
+        sq_distance_to_center = ((point_coords - image_center) ** 2).sum(axis=1)
 
         # Identify closest point to center
-        point_distances = df.loc[df['class'] == 'point', 'distance_to_center']
-        if point_distances.empty:
-            raise AssertionError("No 'point' class detected in the underview image.")
-            
-        min_distance = point_distances.min()
-        df['is_closest_to_center'] = ((df['class'] == 'point') & 
-                                     (df['distance_to_center'] == min_distance) & 
-                                     (df['distance_to_center'] < 100))
-        
-        print(df)
-        
-        if not df['is_closest_to_center'].any():
+        closest_index = int(np.argmin(sq_distance_to_center))
+        if DEBUG_CALIBRATION:
+            print(f"Underview detections: {len(classes)} ({len(point_coords)} points, {int(tip_mask.sum())} tips), "
+                  f"closest point {np.sqrt(sq_distance_to_center[closest_index]):.1f}px from center")
+
+        if sq_distance_to_center[closest_index] >= 100 * 100:
             raise AssertionError("No suitable center point found.")
-            
-        if 'tip' not in df['class'].values:
-            raise AssertionError("No 'tip' class detected in the underview image.")
 
         # Calculate linear distance ratio
-        closest_point_mask = df['is_closest_to_center'] & (df['class'] == 'point')
-        closest_point_coords = df.loc[closest_point_mask, ['center_x', 'center_y']].values[0]
-        
-        point_coords = df.loc[df['class'] == 'point', ['center_x', 'center_y']].values
-        distances_from_closest = np.sqrt(
-            (closest_point_coords[0] - point_coords[:, 0])**2 +
-            (closest_point_coords[1] - point_coords[:, 1])**2
-        )
+        closest_point_coords = point_coords[closest_index]
+        distances_from_closest = np.sqrt(((point_coords - closest_point_coords) ** 2).sum(axis=1))
         distances_from_closest = distances_from_closest[distances_from_closest > 0]
         
         if len(distances_from_closest) == 0:
@@ -435,11 +462,12 @@ class LabwareModel:
         linear_distance_ratio = 20.25 / np.mean(distances_from_closest)
 
         # Calculate distance to tip
-        tip_coords = df.loc[df['class'] == 'tip', ['center_x', 'center_y']].values[0]
+        tip_coords = coords[tip_mask][0]
         x_dist_to_tip = closest_point_coords[0] - tip_coords[0]
         y_dist_to_tip = closest_point_coords[1] - tip_coords[1]
         
-        print(f"Pixel distances to tip: x={x_dist_to_tip}, y={y_dist_to_tip}")
+        if DEBUG_CALIBRATION:
+            print(f"Pixel distances to tip: x={x_dist_to_tip}, y={y_dist_to_tip}")
 
         # Convert to mm (note: coordinate system transformation)
         y_dist_to_tip_mm = x_dist_to_tip * linear_distance_ratio
@@ -469,12 +497,11 @@ class LabwareModel:
             
             # Step 1: Setup
             self._ensure_lights_on()
-            tf_mtx, calib_origin, offset, model = self._load_calibration_resources()
-            calibration_data = utils.load_calibration_config(globals.calibration_profile)
+            tf_mtx, calib_origin, offset, model, calibration_data = self._load_calibration_resources()
 
             
             # Configuration constants
-            CALIB_MODULE_COORDINATES = calib_origin = np.array(calibration_data['calib_origin'])[:2]
+            CALIB_MODULE_COORDINATES = calib_origin
             CALIB_MODULE_HEIGHT = 69
             DETECTION_OFFSET_X = -4
             DETECTION_OFFSET_Y = 0
@@ -494,7 +521,7 @@ class LabwareModel:
             if frame is None:
                 raise AssertionError("Failed to capture frame from overview camera.")
                 
-            image = frame.copy()[..., ::-1]  # Convert BGR to RGB
+            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             image_center = (image.shape[1] // 2, image.shape[0] // 2)
             
             data = self._predict_objects(model, image)
@@ -511,8 +538,8 @@ class LabwareModel:
             crosshair_x, crosshair_y = closest_obj['center_x'], closest_obj['center_y']
 
             # Step 4: Calculate and move to target coordinates
-            target_x, target_y, diff = self._calculate_robot_coordinates(
-                crosshair_x, crosshair_y, tf_mtx, calibration_data, 
+            target_x, target_y, point_xy = self._calculate_robot_coordinates(
+                crosshair_x, crosshair_y, tf_mtx, calib_origin, offset, 
                 DETECTION_OFFSET_X, DETECTION_OFFSET_Y
             )
             
@@ -528,17 +555,19 @@ class LabwareModel:
             if under_frame is None:
                 raise AssertionError("Failed to capture frame from underview camera.")
                 
-            under_image = under_frame[..., ::-1]  # Convert BGR to RGB
+            under_image = cv2.cvtColor(under_frame, cv2.COLOR_BGR2RGB)
             under_image_center = (under_image.shape[1] // 2, under_image.shape[0] // 2)
             
             under_data = self._predict_objects(model, under_image)
-            df = pd.DataFrame(under_data)
             
-            if df.empty:
+            if not len(under_data['class']):
                 raise AssertionError("No objects detected in underview image.")
+            # Fail before any distance math if the tip was not found
+            if not (under_data['class'] == 'tip').any():
+                raise AssertionError("No 'tip' class detected in the underview image.")
 
             # Step 6: Calculate tip offset
-            x_dist_to_tip_mm, y_dist_to_tip_mm = self._analyze_tip_position(df, under_image_center)
+            x_dist_to_tip_mm, y_dist_to_tip_mm = self._analyze_tip_position(under_data, under_image_center)
             
             if not (x_dist_to_tip_mm and y_dist_to_tip_mm):
                 raise AssertionError("Failed to calculate distances to tip.")
@@ -562,12 +591,13 @@ class LabwareModel:
             print(f"Actual offset applied: ({actual_offset_x:.2f}, {actual_offset_y:.2f}) mm")
             current_x, current_y, _ = globals.robot_api.get_position(verbose=False)[0].values()
             
-            # Calculate new offset based on current position
-            X_init, Y_init, _ = tf_mtx @ (crosshair_x, crosshair_y, 1)
-            calibration_data['offset'] = [current_x - (X_init + diff[0]), 
-                                        current_y - (Y_init + diff[1])]
+            # Calculate new offset based on current position. Build a copy so the
+            # cached config is untouched if the save fails
+            new_calibration_data = {**calibration_data,
+                                    'offset': [current_x - point_xy[0],
+                                               current_y - point_xy[1]]}
 
-            utils.save_calibration_config(globals.calibration_profile, calibration_data)
+            utils.save_calibration_config(globals.calibration_profile, new_calibration_data)
 
             # Step 10: Retract and finish
             globals.robot_api.retract_axis('leftZ')
@@ -1,19 +1,68 @@
 import Model.globals as globals
-from Model.worker import Worker
-from PyQt6.QtCore import QThread
+from Model.worker import PooledWorker
+from PyQt6.QtCore import QThreadPool
 import keyboard
+import queue
+import threading
+import time
+
+# How long a fetched robot position may be reused before asking the robot again (seconds)
+POSITION_CACHE_TTL = 0.25
+# Minimum time between successful-step messages while a key is held (seconds)
+MOVE_MESSAGE_INTERVAL = 0.25
+
+# Index of each axis in an (x, y, z) position tuple
+AXIS_INDEX = {'x': 0, 'y': 1, 'z': 2}
+
+# Single-step movement methods -> (axis, direction, label), used to merge queued key repeats
+MOVE_STEPS = {
+    'move_forward': ('y', 1, "forward"),
+    'move_backward': ('y', -1, "backward"),
+    'move_left': ('x', -1, "left"),
+    'move_right': ('x', 1, "right"),
+    'move_z_down': ('z', -1, "Z down"),
+    'move_z_up': ('z', 1, "Z up"),
+}
+STEP_LABELS = {(axis, sign): label for axis, sign, label in MOVE_STEPS.values()}
+
+# Hotkey -> ManualMovementModel method run when it is pressed
+KEYBOARD_BINDINGS = (
+    ('up', 'move_forward'),
+    ('down', 'move_backward'),
+    ('left', 'move_left'),
+    ('right', 'move_right'),
+    ('pagedown', 'move_z_down'),
+    ('pageup', 'move_z_up'),
+    ('+', 'increase_step'),
+    ('-', 'decrease_step'),
+    ('s', 'save_position'),
+    ('a', 'aspirate_in_place_action'),
+    ('d', 'dispense_in_place_action'),
+    ('b', 'blow_out_in_place_action'),
+)
 
 
 class ManualMovementModel:
     """Placeholder model for manual movement controls."""
     def __init__(self):
-        self.active_threads = []
         # Keyboard movement attributes
         self.keyboard_active = False
         self.positions = []
         self.possible_steps = [0.01, 0.1, 0.5, 1, 3, 5, 10, 30, 50]
-        self.step = 1
+        self._step_index = {step: index for index, step in enumerate(self.possible_steps)}
+        self._step_idx = self._step_index[1]
+        self.step = self.possible_steps[self._step_idx]
         self.hotkeys = []
+        # Hotkey actions run in order on one pool thread instead of one task per key event
+        self._keyboard_queue = queue.Queue()
+        self._keyboard_lock = threading.Lock()
+        self._keyboard_worker_running = False
+        # Last known robot position, advanced locally after each keyboard step
+        self._cached_position = None
+        self._cached_position_ts = 0.0
+        self._last_move_message_ts = 0.0
+        # Stop runs on its own pool so it never queues behind motion tasks in the global pool
+        self.stop_pool = QThreadPool()
         
         # Pipetting parameters for "in place" operations
         self.aspirate_volume = 25
@@ -23,11 +72,10 @@ class ManualMovementModel:
         self.dispense_pushout = 0
         self.blow_out_flow_rate = 25
 
-    def run_in_thread(self, fn, *args, on_result=None, on_error=None, on_finished=None, **kwargs):
-        """Run a function in a separate thread using Worker."""
-        thread = QThread()
-        worker = Worker(fn, *args, **kwargs)
-        worker.moveToThread(thread)
+    def run_in_thread(self, fn, *args, on_result=None, on_error=None, on_finished=None, pool=None, **kwargs):
+        """Run a function on a Qt thread pool (the shared one by default) using Worker."""
+        runnable = PooledWorker(fn, *args, **kwargs)
+        worker = runnable.worker
 
         if on_result:
             worker.result.connect(on_result)
@@ -36,20 +84,8 @@ class ManualMovementModel:
         if on_finished:
             worker.finished.connect(on_finished)
 
-        def cleanup():
-            if thread in self.active_threads:
-                self.active_threads.remove(thread)
-            thread.quit()
-            thread.wait()  # Wait for thread to finish
-            worker.deleteLater()
-            thread.deleteLater()
-
-        worker.finished.connect(cleanup)
-        thread.started.connect(worker.run)
-
-        self.active_threads.append(thread)
-        thread.start()
-        return thread
+        (pool or QThreadPool.globalInstance()).start(runnable)
+        return runnable
 
     def activate_keyboard_movement(self):
         """Activate keyboard movement controls."""
@@ -66,18 +102,9 @@ class ManualMovementModel:
             self.deactivate_keyboard_movement()
             
             # Add hotkeys
-            self.hotkeys.append(keyboard.add_hotkey('up', lambda: self.run_in_thread(self.move_forward)))
-            self.hotkeys.append(keyboard.add_hotkey('down', lambda: self.run_in_thread(self.move_backward)))
-            self.hotkeys.append(keyboard.add_hotkey('left', lambda: self.run_in_thread(self.move_left)))
-            self.hotkeys.append(keyboard.add_hotkey('right', lambda: self.run_in_thread(self.move_right)))
-            self.hotkeys.append(keyboard.add_hotkey('pagedown', lambda: self.run_in_thread(self.move_z_down)))
-            self.hotkeys.append(keyboard.add_hotkey('pageup', lambda: self.run_in_thread(self.move_z_up)))
-            self.hotkeys.append(keyboard.add_hotkey('+', lambda: self.run_in_thread(self.increase_step)))
-            self.hotkeys.append(keyboard.add_hotkey('-', lambda: self.run_in_thread(self.decrease_step)))
-            self.hotkeys.append(keyboard.add_hotkey('s', lambda: self.run_in_thread(self.save_position)))
-            self.hotkeys.append(keyboard.add_hotkey('a', lambda: self.run_in_thread(self.aspirate_in_place_action)))
-            self.hotkeys.append(keyboard.add_hotkey('d', lambda: self.run_in_thread(self.dispense_in_place_action)))
-            self.hotkeys.append(keyboard.add_hotkey('b', lambda: self.run_in_thread(self.blow_out_in_place_action)))
+            for key, action_name in KEYBOARD_BINDINGS:
+                action = getattr(self, action_name)
+                self.hotkeys.append(keyboard.add_hotkey(key, self._queue_keyboard_action, args=(action,)))
             
             self.keyboard_active = True
             print("Keyboard movement activated")
@@ -90,6 +117,60 @@ class ManualMovementModel:
             print(f"Error activating keyboard movement: {e}")
             return False
 
+    def _queue_keyboard_action(self, action):
+        """Queue a hotkey action, starting the keyboard worker if it is idle."""
+        self._keyboard_queue.put_nowait(action)
+        with self._keyboard_lock:
+            if self._keyboard_worker_running:
+                return
+            self._keyboard_worker_running = True
+        self.run_in_thread(self._process_keyboard_queue)
+
+    def _process_keyboard_queue(self):
+        """Run queued hotkey actions in order until the queue is empty.
+
+        Consecutive steps along the same axis are merged into a single move.
+        """
+        while True:
+            actions = []
+            try:
+                while True:
+                    actions.append(self._keyboard_queue.get_nowait())
+            except queue.Empty:
+                pass
+            if not actions:
+                # Re-check under the lock so an action queued just now is not stranded
+                with self._keyboard_lock:
+                    if self._keyboard_queue.empty():
+                        self._keyboard_worker_running = False
+                        return
+                continue
+
+            pending_axis, pending_steps = None, 0
+            for action in actions:
+                move = MOVE_STEPS.get(getattr(action, '__name__', None))
+                if move is not None and move[0] == pending_axis:
+                    pending_steps += move[1]
+                    continue
+                self._flush_axis_steps(pending_axis, pending_steps)
+                if move is not None:
+                    pending_axis, pending_steps = move[0], move[1]
+                    continue
+                pending_axis, pending_steps = None, 0
+                try:
+                    action()
+                except Exception as e:
+                    # Keep draining so one failing action does not stall the keyboard controls
+                    print(f"Error running keyboard action: {e}")
+            self._flush_axis_steps(pending_axis, pending_steps)
+
+    def _flush_axis_steps(self, axis, steps):
+        """Issue the net of merged key steps along one axis as a single move."""
+        if axis is None or steps == 0:
+            return
+        sign = 1 if steps > 0 else -1
+        self._step_axis(axis, sign, STEP_LABELS[(axis, sign)], abs(steps))
+
     def deactivate_keyboard_movement(self):
         """Deactivate keyboard movement controls."""
         try:
@@ -106,155 +187,97 @@ class ManualMovementModel:
     def position_safeguard(self, position):
         """Check if the position is within safe bounds."""
         x, y, z = position
-        x_condition = x >= 0 and x <= 380
-        y_condition = y >= 0 and y <= 350
-        z_condition = z >= 0.1 and z <= 205
-
-        return x_condition and y_condition and z_condition
+        return 0 <= x <= 380 and 0 <= y <= 350 and 0.1 <= z <= 205
 
     def get_current_position(self):
-        """Get current robot position."""
+        """Get current robot position, reusing a recent reading when available."""
+        if self._cached_position is not None and time.monotonic() - self._cached_position_ts < POSITION_CACHE_TTL:
+            return self._cached_position
         try:
             position_data = globals.robot_api.get_position(verbose=False)
             if position_data and len(position_data) > 0:
-                return position_data[0].values()
+                position = position_data[0]
+                self._cached_position = (position['x'], position['y'], position['z'])
+                self._cached_position_ts = time.monotonic()
+                return self._cached_position
             return None
         except Exception as e:
             print(f"Error getting position: {e}")
             return None
 
-    def move_z_down(self):
-        """Move Z axis down by current step size."""
+    def _invalidate_position(self):
+        """Forget the cached position after a move this model cannot track locally."""
+        self._cached_position = None
+
+    def _step_axis(self, axis, sign, label, count=1):
+        """Move one axis by up to count steps of the current size in the given direction, staying in bounds."""
         try:
             position = self.get_current_position()
             if position is None:
                 return False
-                
-            x, y, z = position
-            potential_position = (x, y, z - self.step)
-            
-            if self.position_safeguard(potential_position):
-                globals.robot_api.move_relative('z', -self.step)
-                print(f"Moved Z down by {self.step}mm")
-                return True
-            else:
-                print(f"Cannot move Z down by {self.step}mm - would exceed safe bounds")
+
+            axis_index = AXIS_INDEX[axis]
+            potential_position = position
+            # Take as many of the merged steps as stay in bounds, as separate presses would
+            steps_taken = 0
+            while steps_taken < count:
+                candidate = list(position)
+                candidate[axis_index] += sign * (steps_taken + 1) * self.step
+                candidate = tuple(candidate)
+                if not self.position_safeguard(candidate):
+                    break
+                potential_position = candidate
+                steps_taken += 1
+
+            if steps_taken < count:
+                print(f"Cannot move {label} by {(count - steps_taken) * self.step:g}mm - would exceed safe bounds")
+            if steps_taken == 0:
                 return False
+
+            step_distance = steps_taken * self.step
+            globals.robot_api.move_relative(axis, sign * step_distance)
+            self._cached_position = potential_position
+            # Rate-limit the success message so key autorepeat doesn't flood the terminal panel
+            now = time.monotonic()
+            if now - self._last_move_message_ts >= MOVE_MESSAGE_INTERVAL:
+                self._last_move_message_ts = now
+                print(f"Moved {label} by {step_distance:g}mm")
+            return True
         except Exception as e:
-            print(f"Error moving Z down: {e}")
+            self._invalidate_position()
+            print(f"Error moving {label}: {e}")
             return False
 
+    def move_z_down(self):
+        """Move Z axis down by current step size."""
+        return self._step_axis('z', -1, "Z down")
+
     def move_z_up(self):
         """Move Z axis up by current step size."""
-        try:
-            position = self.get_current_position()
-            if position is None:
-                return False
-                
-            x, y, z = position
-            potential_position = (x, y, z + self.step)
-            
-            if self.position_safeguard(potential_position):
-                globals.robot_api.move_relative('z', self.step)
-                print(f"Moved Z up by {self.step}mm")
-                return True
-            else:
-                print(f"Cannot move Z up by {self.step}mm - would exceed safe bounds")
-                return False
-        except Exception as e:
-            print(f"Error moving Z up: {e}")
-            return False
+        return self._step_axis('z', 1, "Z up")
 
     def move_forward(self):
         """Move Y axis forward by current step size."""
-        try:
-            position = self.get_current_position()
-            if position is None:
-                return False
-                
-            x, y, z = position
-            potential_position = (x, y + self.step, z)
-            
-            if self.position_safeguard(potential_position):
-                globals.robot_api.move_relative('y', self.step)
-                print(f"Moved forward by {self.step}mm")
-                return True
-            else:
-                print(f"Cannot move forward by {self.step}mm - would exceed safe bounds")
-                return False
-        except Exception as e:
-            print(f"Error moving forward: {e}")
-            return False
+        return self._step_axis('y', 1, "forward")
 
     def move_backward(self):
         """Move Y axis backward by current step size."""
-        try:
-            position = self.get_current_position()
-            if position is None:
-                return False
-                
-            x, y, z = position
-            potential_position = (x, y - self.step, z)
-            
-            if self.position_safeguard(potential_position):
-                globals.robot_api.move_relative('y', -self.step)
-                print(f"Moved backward by {self.step}mm")
-                return True
-            else:
-                print(f"Cannot move backward by {self.step}mm - would exceed safe bounds")
-                return False
-        except Exception as e:
-            print(f"Error moving backward: {e}")
-            return False
+        return self._step_axis('y', -1, "backward")
 
     def move_left(self):
         """Move X axis left by current step size."""
-        try:
-            position = self.get_current_position()
-            if position is None:
-                return False
-                
-            x, y, z = position
-            potential_position = (x - self.step, y, z)
-            
-            if self.position_safeguard(potential_position):
-                globals.robot_api.move_relative('x', -self.step)
-                print(f"Moved left by {self.step}mm")
-                return True
-            else:
-                print(f"Cannot move left by {self.step}mm - would exceed safe bounds")
-                return False
-        except Exception as e:
-            print(f"Error moving left: {e}")
-            return False
+        return self._step_axis('x', -1, "left")
 
     def move_right(self):
         """Move X axis right by current step size."""
-        try:
-            position = self.get_current_position()
-            if position is None:
-                return False
-                
-            x, y, z = position
-            potential_position = (x + self.step, y, z)
-            
-            if self.position_safeguard(potential_position):
-                globals.robot_api.move_relative('x', self.step)
-                print(f"Moved right by {self.step}mm")
-                return True
-            else:
-                print(f"Cannot move right by {self.step}mm - would exceed safe bounds")
-                return False
-        except Exception as e:
-            print(f"Error moving right: {e}")
-            return False
+        return self._step_axis('x', 1, "right")
 
     def increase_step(self):
         """Increase the movement step size."""
         try:
-            current_index = self.possible_steps.index(self.step)
-            if current_index < len(self.possible_steps) - 1:
-                self.step = self.possible_steps[current_index + 1]
+            if self._step_idx < len(self.possible_steps) - 1:
+                self._step_idx += 1
+                self.step = self.possible_steps[self._step_idx]
                 print(f"Step size increased to {self.step}mm")
             else:
                 print(f"Already at maximum step size: {self.step}mm")
@@ -266,9 +289,9 @@ class ManualMovementModel:
     def decrease_step(self):
         """Decrease the movement step size."""
         try:
-            current_index = self.possible_steps.index(self.step)
-            if current_index > 0:
-                self.step = self.possible_steps[current_index - 1]
+            if self._step_idx > 0:
+                self._step_idx -= 1
+                self.step = self.possible_steps[self._step_idx]
                 print(f"Step size decreased to {self.step}mm")
             else:
                 print(f"Already at minimum step size: {self.step}mm")
@@ -294,8 +317,8 @@ class ManualMovementModel:
             return False
 
     def get_saved_positions(self):
-        """Get all saved positions."""
-        return self.positions.copy()
+        """Get all saved positions as a read-only tuple."""
+        return tuple(self.positions)
 
     def clear_saved_positions(self):
         """Clear all saved positions."""
@@ -308,8 +331,10 @@ class ManualMovementModel:
 
     def set_step(self, step):
         """Set the step size."""
-        if step in self.possible_steps:
-            self.step = step
+        index = self._step_index.get(step)
+        if index is not None:
+            self._step_idx = index
+            self.step = self.possible_steps[index]
             print(f"Step size set to {self.step}mm")
             return True
         else:
@@ -326,6 +351,7 @@ class ManualMovementModel:
             print("Robot not initialized. Please initialize first.")
             return False
         globals.robot_api.drop_tip_in_place()
+        self._invalidate_position()
         return True
         
     def stop(self):
@@ -334,6 +360,7 @@ class ManualMovementModel:
             print("Robot not initialized. Please initialize first.")
             return False
         globals.robot_api.control_run("stop")
+        self._invalidate_position()
         return True
 
     def move_robot(self, x: float, y: float, z: float) -> bool:
@@ -341,6 +368,7 @@ class ManualMovementModel:
             print("Robot not initialized. Please initialize first.")
             return False
         globals.robot_api.move_to_coordinates((x,y,z))
+        self._invalidate_position()
         return True
 
     def retract_axis(self, axis: str) -> bool:
@@ -350,6 +378,7 @@ class ManualMovementModel:
                 print("Robot not initialized. Please initialize first.")
                 return False
             globals.robot_api.retract_axis(axis)
+            self._invalidate_position()
             print(f"Retracting axis: {axis}")
             return True
         except Exception as e:
@@ -367,6 +396,7 @@ class ManualMovementModel:
                 return False
             globals.robot_api.aspirate(labware_id, well_name, well_location, offset, 
                                      volume_offset, volume, flow_rate)
+            self._invalidate_position()
             print(f"Aspirated {volume}uL from {well_name} at {flow_rate}uL/s")
             return True
         except Exception as e:
@@ -383,6 +413,7 @@ class ManualMovementModel:
                 return False
             globals.robot_api.dispense(labware_id, well_name, well_location, offset,
                                      volume_offset, volume, flow_rate, pushout)
+            self._invalidate_position()
             print(f"Dispensed {volume}uL to {well_name} at {flow_rate}uL/s")
             return True
         except Exception as e:
@@ -397,6 +428,7 @@ class ManualMovementModel:
                 print("Robot not initialized. Please initialize first.")
                 return False
             globals.robot_api.blow_out(labware_id, well_name, well_location, flow_rate)
+            self._invalidate_position()
             print(f"Blew out to {well_name} at {flow_rate}uL/s")
             return True
         except Exception as e:
@@ -414,6 +446,7 @@ class ManualMovementModel:
                 return False
             globals.robot_api.move_to_well(labware_id, well_name, well_location, offset,
                                          volume_offset, False, force_direct, speed, min_z_height)
+            self._invalidate_position()
             print(f"Moved to {well_name} in {well_location}")
             return True
         except Exception as e:
@@ -1,7 +1,31 @@
 import requests
 import json
 import functools
-from typing import Union
+import contextlib
+from typing import Optional, Union
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        """Encode a request body with orjson, refusing NaN and infinity.
+
+        orjson silently writes non-finite floats as null, which the robot reads as
+        "use the default" for optional parameters such as minimumZHeight or speed.
+        Bodies containing null are re-encoded with the stdlib so those raise instead.
+        """
+        # numpy scalars (e.g. coordinates computed during calibration) are float subclasses orjson won't take by default
+        payload = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        if b"null" in payload:
+            return json.dumps(obj, allow_nan=False, default=lambda o: o.tolist()).encode()
+        return payload
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Body of the home command never changes, so encode it once
+HOME_PAYLOAD = _json_dumps({"target": "robot"})
 
 class Decorators():
     def check_error(func):
@@ -47,6 +71,54 @@ class OpentronsAPI(Decorators):
         self.protocol_id = None
         self.labware_dct = {str(i): None for i in range(1, 12)}
         self.slot_offsets = {"data":[]}
+        # One keep-alive session for all requests to the robot's server
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        # Encoded bodies of commands whose only parameter is the pipette ID, keyed by (commandType, pipetteId)
+        self._pipette_payloads = {}
+
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        self.session.close()
+
+    def _pipette_command_payload(self, command_type: str) -> Union[bytes, str]:
+        """Return the encoded body of a command whose only parameter is the current pipette ID."""
+        key = (command_type, self.pipette_id)
+        payload = self._pipette_payloads.get(key)
+        if payload is None:
+            command_dict = {
+                "data": {
+                    "commandType": command_type,
+                    "params": {
+                        "pipetteId": self.pipette_id
+                    },
+                    "intent": "setup"
+                }
+            }
+            payload = self._pipette_payloads[key] = _json_dumps(command_dict)
+        return payload
+
+    def _move_to_coordinates_payload(self, coordinates, min_z_height: float,
+                                     force_direct: bool) -> Optional[Union[bytes, str]]:
+        """Return the encoded moveToCoordinates body, or None if coordinates is not an x,y,z triple."""
+        if len(coordinates) != 3:
+            print(f'Coordinate tuple needs 3 values, got {len(coordinates)} instead.')
+            return None
+
+        x,y,z = coordinates
+        command_dict = {
+            "data": {
+                "commandType": "moveToCoordinates",
+                "params": {
+                    "coordinates": {"x": x, "y": y, "z": z},
+                    "minimumZHeight": min_z_height,
+                    "forceDirect": force_direct,
+                    "pipetteId": self.pipette_id
+                },
+                "intent": "setup"
+            }
+        }
+        return _json_dumps(command_dict)
 
     def get_url(self, endpoint_key: str) -> str:
         """Construct the full URL for a given endpoint key."""
@@ -74,7 +146,7 @@ class OpentronsAPI(Decorators):
         """        
         url = self.get_url(endpoint_key)
 
-        r = requests.post(
+        r = self.session.post(
             url=url,
             headers=headers,
             params=params,
@@ -96,7 +168,7 @@ class OpentronsAPI(Decorators):
         """        
         url = self.get_url(endpoint_key)
 
-        r = requests.get(
+        r = self.session.get(
             url=url,
             headers=headers)
         return r
@@ -107,7 +179,7 @@ class OpentronsAPI(Decorators):
         Args:
             responce (requests.models.Response): a responce object from the robot's server.
         """        
-        json_formatted_str = json.dumps(json.loads(responce.text), indent = 2)
+        json_formatted_str = json.dumps(_json_loads(responce.content), indent = 2)
         print(f"Request status:\n{responce}\n{json_formatted_str}")
     
     def toggle_lights(self, verbose: bool = False) -> requests.models.Response:
@@ -117,9 +189,9 @@ class OpentronsAPI(Decorators):
             verbose (bool, optional): Print the responce from server or not. Defaults to False.
         """        
         current_status = self.get("lights", self.HEADERS)
-        current_status = json.loads(current_status.text)
+        current_status = _json_loads(current_status.content)
         is_on = current_status['on']
-        responce_data = json.dumps({"on": not(is_on)})
+        responce_data = _json_dumps({"on": not(is_on)})
         r = self.post("lights", headers=self.HEADERS, data=responce_data)
         if verbose:
             self.display_responce(r)
@@ -136,19 +208,19 @@ class OpentronsAPI(Decorators):
             verbose (bool, optional): Print the responce from server or not. Defaults to True.
         """        
         if protocol_id:
-            protocol_id_payload = json.dumps({"data":{"protocolId": protocol_id}})
+            protocol_id_payload = _json_dumps({"data":{"protocolId": protocol_id}})
             r = self.post("runs", self.HEADERS, data = protocol_id_payload)
         else:
             r = self.post("runs", self.HEADERS)
         
-        resp_dict = json.loads(r.text)
+        resp_dict = _json_loads(r.content)
         if 'data' not in resp_dict:
             print('Error creating run...')
         else:
             if 'id' not in resp_dict['data']:
                 print('Error creating run...')
             else:
-                run_id = json.loads(r.text)['data']['id']
+                run_id = resp_dict['data']['id']
                 self.run_id = run_id
                 self.ENDPOINTS['commands'] = f"/runs/{run_id}/commands"
                 self.ENDPOINTS['actions'] = f"/runs/{run_id}/actions"
@@ -173,7 +245,7 @@ class OpentronsAPI(Decorators):
             dict: dictionary detailed info about the runs. 
         """        
         all_runs_json = self.get_all_runs()
-        all_runs_json = json.loads(all_runs_json.text)
+        all_runs_json = _json_loads(all_runs_json.content)
         data = all_runs_json['data']
         current_run_id = None
         current_run_status = None
@@ -207,9 +279,7 @@ class OpentronsAPI(Decorators):
         Args:
             verbose (bool, optional): Print the responce from server or not. Defaults to True.
         """        
-        command_dict = {"target": "robot"}
-        command_payload = json.dumps(command_dict)
-        r = self.post("home", headers=self.HEADERS, data = command_payload)
+        r = self.post("home", headers=self.HEADERS, data = HOME_PAYLOAD)
         if verbose:
             self.display_responce(r)
         return r
@@ -258,11 +328,11 @@ class OpentronsAPI(Decorators):
                 "intent": "setup"
             }
         }
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers= self.HEADERS,
                       params={"waitUntilComplete": True}, data = command_payload)
         
-        r_dict = json.loads(r.text)
+        r_dict = _json_loads(r.content)
         assert r_dict['data']['status'] == 'succeeded', "Error loading pipette..."
         self.pipette_id = r_dict['data']['result']['pipetteId']
         
@@ -281,23 +351,19 @@ class OpentronsAPI(Decorators):
             LABWARE_FILE (str, optional): path to a custom labware file. Defaults to None.
             verbose (bool, optional): Print the responce from server or not. Defaults to True.
         """        
-        protocol_file_payload = open(PROTOCOL_FILE, "rb")
-        files = [("files", protocol_file_payload)]
-        if LABWARE_FILE:
-            labware_file_payload = open(LABWARE_FILE, "rb")
-            files.append(("files", labware_file_payload))
+        # Close the uploaded files even if the request fails
+        with contextlib.ExitStack() as stack:
+            files = [("files", stack.enter_context(open(PROTOCOL_FILE, "rb")))]
+            if LABWARE_FILE:
+                files.append(("files", stack.enter_context(open(LABWARE_FILE, "rb"))))
 
-        r = self.post("protocols", headers = self.HEADERS, files = files)
+            r = self.post("protocols", headers = self.HEADERS, files = files)
 
         if verbose:
             self.display_responce(r)
-        r_dict = json.loads(r.text)
+        r_dict = _json_loads(r.content)
         self.protocol_id = r_dict["data"]["id"]
         print(f"Protocol ID:\n{self.protocol_id}")
-
-        protocol_file_payload.close()
-        if LABWARE_FILE:
-            labware_file_payload.close()
         return r
 
     @Decorators.require_ids(["run_id"])
@@ -305,7 +371,7 @@ class OpentronsAPI(Decorators):
         """Method for execution of a run labeled as the current one."""
         
         assert action in ["play", "pause", "stop", "resume-from-recovery"], "Invalid action argument..."
-        payload = json.dumps({"data":{"actionType": action}})
+        payload = _json_dumps({"data":{"actionType": action}})
         r = self.post("actions", headers=self.HEADERS, data=payload)
         return r
 
@@ -322,25 +388,10 @@ class OpentronsAPI(Decorators):
             force_direct (bool, optional): Force direct movement from one point to the other. Defaults to False.
             verbose (bool, optional): Print the responce from server or not. Defaults to True.
         """        
-        if len(coordinates) != 3:
-            print(f'Coordinate tuple needs 3 values, got {len(coordinates)} instead.')
+        command_payload = self._move_to_coordinates_payload(coordinates, min_z_height, force_direct)
+        if command_payload is None:
             return
 
-        x,y,z = coordinates
-        command_dict = {
-            "data": {
-                "commandType": "moveToCoordinates",
-                "params": {
-                    "coordinates": {"x": x, "y": y, "z": z},
-                    "minimumZHeight": min_z_height,
-                    "forceDirect": force_direct,
-                    "pipetteId": self.pipette_id
-                },
-                "intent": "setup"
-            }
-        }
-
-        command_payload = json.dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                       params={"waitUntilComplete": True}, data = command_payload)
         if verbose == True:
@@ -348,6 +399,45 @@ class OpentronsAPI(Decorators):
 
         return r
     
+    @Decorators.require_ids(["run_id", "pipette_id"])
+    def move_to_coordinates_batch(self, coordinates_list, 
+                                        min_z_height: float = 20.0, 
+                                        force_direct: bool = False, 
+                                        verbose: bool = True) -> requests.models.Response:
+        """Method to move the robot's end-effector through several coordinate positions in order, waiting
+           only for the last move. The robot executes queued commands sequentially, so once the last move
+           has completed all earlier ones have as well.
+
+        Args:
+            coordinates_list (iterable): Iterable of x,y,z tuples (or an (N, 3) array).
+            min_z_height (float, optional): Minimum height above the platform. Defaults to 20.0.
+            force_direct (bool, optional): Force direct movement from one point to the other. Defaults to False.
+            verbose (bool, optional): Print the responce from server or not. Defaults to True.
+
+        Returns:
+            requests.models.Response: responce object from the robot's server for the last move.
+        """
+        if hasattr(coordinates_list, 'tolist'):
+            coordinates_list = coordinates_list.tolist()
+        # Encode every move up front so an invalid entry aborts before the robot moves
+        payloads = []
+        for coordinates in coordinates_list:
+            command_payload = self._move_to_coordinates_payload(coordinates, min_z_height, force_direct)
+            if command_payload is None:
+                return
+            payloads.append(command_payload)
+        if not payloads:
+            return
+
+        last_index = len(payloads) - 1
+        for index, command_payload in enumerate(payloads):
+            r = self.post("commands", headers = self.HEADERS,
+                          params={"waitUntilComplete": index == last_index}, data = command_payload)
+        if verbose == True:
+            self.display_responce(r)
+
+        return r
+
     @Decorators.require_ids(["run_id", "pipette_id"])
     def move_to_well(self, labware_id: str, 
                             well_name: str,  
@@ -381,7 +471,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                     params={"waitUntilComplete": True}, data = command_payload)
 
@@ -416,7 +506,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                       params={"waitUntilComplete": True}, data = command_payload)
         if verbose == True:
@@ -436,21 +526,11 @@ class OpentronsAPI(Decorators):
             dict: returns dictionary with coordinates: {"x":, "y":, "z":}.
         """        
         
-        command_dict = {
-            "data" : {
-                "commandType": "savePosition",
-                "params": {
-                    "pipetteId": self.pipette_id,
-                },
-                "intent": "setup"
-            }
-        }
-
-        command_payload = json.dumps(command_dict)
+        command_payload = self._pipette_command_payload("savePosition")
         r = self.post("commands", headers = self.HEADERS, 
                   params={"waitUntilComplete": True}, data = command_payload)
         
-        r_dict = json.loads(r.text)
+        r_dict = _json_loads(r.content)
         assert r_dict['data']['status'] == 'succeeded', "Error getting position..."
 
         coordinates = r_dict['data']['result']['position']
@@ -498,11 +578,11 @@ class OpentronsAPI(Decorators):
             print(f"Labware URI:\n{labware_uri}\n")
             print("Check offset before using ...")
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                   params={"waitUntilComplete": True}, data = command_payload)
         
-        r_dict = json.loads(r.text)
+        r_dict = _json_loads(r.content)
         assert r_dict['data']['status'] == 'succeeded', "Error loading labware..."
 
         #Cheking if offset was applied to the labware
@@ -545,7 +625,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        data_payload = json.dumps(data)
+        data_payload = _json_dumps(data)
         r = self.post("runLabwareOffsets", headers = self.HEADERS,
                   params={"waitUntilComplete": True}, data = data_payload)
         return r
@@ -579,7 +659,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                   params={"waitUntilComplete": True}, data = command_payload)
         
@@ -618,7 +698,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                   params={"waitUntilComplete": True}, data = command_payload)
         
@@ -659,7 +739,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                   params={"waitUntilComplete": True}, data = command_payload)
         
@@ -678,17 +758,7 @@ class OpentronsAPI(Decorators):
             requests.models.Response: responce object from the robot's server.
         """
         
-        command_dict = {
-            "data": {
-                "commandType": "dropTipInPlace",
-                "params": {
-                    "pipetteId": self.pipette_id
-                },
-                "intent": "setup"
-            }
-        }
-
-        command_payload = json.dumps(command_dict)
+        command_payload = self._pipette_command_payload("dropTipInPlace")
         r = self.post("commands", headers = self.HEADERS,
                   params={"waitUntilComplete": True}, data = command_payload)
         
@@ -739,7 +809,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                     params={"waitUntilComplete": True}, data = command_payload)
 
@@ -771,7 +841,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                     params={"waitUntilComplete": True}, data = command_payload)
 
@@ -825,7 +895,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                     params={"waitUntilComplete": True}, data = command_payload)
 
@@ -859,7 +929,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                     params={"waitUntilComplete": True}, data = command_payload)
 
@@ -896,7 +966,7 @@ class OpentronsAPI(Decorators):
                     }
                 }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                     params={"waitUntilComplete": True}, data = command_payload)
         
@@ -931,7 +1001,7 @@ class OpentronsAPI(Decorators):
                     }
                 }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                     params={"waitUntilComplete": True}, data = command_payload)
         
@@ -959,7 +1029,7 @@ class OpentronsAPI(Decorators):
             }
         }
 
-        command_payload = json.dumps(command_dict)
+        command_payload = _json_dumps(command_dict)
         r = self.post("commands", headers = self.HEADERS,
                     params={"waitUntilComplete": True}, data = command_payload)
         
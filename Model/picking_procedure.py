@@ -398,8 +398,8 @@ class PickingProcedure():
                 # well = self.shared_settings_inst.routine.get_next_well()
                 # Get latest coordinates from the queue (non-blocking)
                 x, y, well = self.coord_queue.get(timeout=1)  # Timeout prevents indefinite blocking
-                self.openapi.move_to_coordinates((x, y, self.config.pickup_height+20), min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
-                self.openapi.move_to_coordinates((x, y, self.config.pickup_height), min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
+                self.openapi.move_to_coordinates_batch([(x, y, self.config.pickup_height+20), (x, y, self.config.pickup_height)],
+                                                       min_z_height=self.config.dish_bottom, verbose=False, force_direct=True)
                 self.openapi.aspirate_in_place(flow_rate = self.config.flow_rate, volume = self.config.vol)
                 self.openapi.move_relative('z', 20)
 
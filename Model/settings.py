@@ -28,7 +28,7 @@ class SettingsModel:
     
     def __init__(self):
         self.lights_on = False
-        self.active_threads=[]
+        self.active_threads = set()
         # Frame capturer will be initialized with proper controller later
         self.frame_capturer = get_frame_capturer()
 
@@ -46,8 +46,7 @@ class SettingsModel:
             worker.finished.connect(on_finished)
 
         def cleanup():
-            if thread in self.active_threads:
-                self.active_threads.remove(thread)
+            self.active_threads.discard(thread)
             thread.quit()
             thread.wait()  # Wait for thread to finish
             worker.deleteLater()
@@ -56,7 +55,7 @@ class SettingsModel:
         worker.finished.connect(cleanup)
         thread.started.connect(worker.run)
 
-        self.active_threads.append(thread)
+        self.active_threads.add(thread)
         thread.start()
         return thread
     
@@ -65,6 +64,9 @@ class SettingsModel:
     def initialize_robot(self) -> bool:
         """Initialize the robot connection."""
         try:
+            if globals.robot_api:
+                # Release the previous instance's pooled connections before replacing it
+                globals.robot_api.close()
             globals.robot_api = OpentronsAPI()  # Use the global Opentrons API instance
             print("Initializing robot...")
             # Simulate initialization
@@ -185,6 +187,7 @@ class SettingsModel:
             if not globals.robot_api:
                 print("Robot not initialized. Please initialize first.")
                 return False
+            globals.robot_api.close()
             globals.robot_api=OpentronsAPI()
             globals.robot_api.create_run()
             
@@ -128,8 +128,13 @@ def load_calibration_config(profile_name):
 
 def save_calibration_config(profile_name, data):
     config_path = os.path.join(paths.PROFILES_DIR, profile_name, 'calibration.json')
-    with open(config_path, 'w') as json_file:
-        json.dump(data, json_file, indent=4)
+    # Serialize before touching the disk so a bad value leaves no stray temporary file
+    content = json.dumps(data, indent=4)
+    # Write to a temporary file first so a crash mid-write cannot corrupt the profile
+    tmp_path = config_path + '.tmp'
+    with open(tmp_path, 'w') as json_file:
+        json_file.write(content)
+    os.replace(tmp_path, config_path)
 
 def check_camera_config(profile_name):
     config_path = os.path.join(paths.PROFILES_DIR, profile_name, 'camera_intrinsics.json')
@@ -1,4 +1,4 @@
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QRunnable, QThread, pyqtSignal, pyqtSlot
 
 class Worker(QObject):
     finished = pyqtSignal()
@@ -27,4 +27,15 @@ class Worker(QObject):
             self.error.emit(str(e))
         finally:
             # Always emit finished
-            self.finished.emit()
\ No newline at end of file
+            self.finished.emit()
+
+class PooledWorker(QRunnable):
+    """Runs a Worker on a QThreadPool thread instead of a dedicated QThread."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.worker = Worker(fn, *args, **kwargs)
+
+    def run(self):
+        """Run the task, emitting the wrapped Worker's signals."""
+        self.worker.run()